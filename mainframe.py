@@ -1,43 +1,296 @@
 import gradio as gr
 import os
+import atexit
 from pathlib import Path
-import glob
 import subprocess
 import platform
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+
+try:
+    import tkinter
+    from tkinter import filedialog
+except ImportError:  # Python builds without Tk fall back to the native dialog commands
+    tkinter = None
+
+IMG_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.webp'})  # Image extensions picked up by load_folder
+SKIPPED_NAMES_SHOWN = 3  # Skipped file names listed in the status line, the rest are only counted
+CAPTION_READ_SIZE = 65536  # Bytes requested per read, far larger than a typical caption
+O_BINARY = getattr(os, 'O_BINARY', 0)  # Stops Windows from translating newlines on raw file descriptors
+THUMB_SIZE = (512, 512)  # Bounding box for displayed images, the image pane is 500px wide
+THUMB_CACHE_SIZE = 32  # Maximum number of decoded thumbnails kept in memory
+fdatasync = getattr(os, 'fdatasync', os.fsync)  # fdatasync is missing on macOS and Windows
+SAVE_DELAY = 0.5  # Seconds of inactivity before a saved caption is written to disk
+SYSTEM = platform.system().lower()  # Detected once, the OS can't change while the app runs
+
+MACOS_PICKER_SCRIPT = '''tell application "System Events"
+    activate
+    set folderPath to choose folder
+    return POSIX path of folderPath
+end tell
+'''
+
+# One statement per line, PowerShell runs stdin scripts line by line
+WINDOWS_PICKER_SCRIPT = '''Add-Type -AssemblyName System.Windows.Forms
+$dialog = New-Object System.Windows.Forms.FolderBrowserDialog
+$dialog.Description = 'Select a folder'
+$dialog.ShowDialog() | Out-Null
+$dialog.SelectedPath
+'''
+
+
+def read_text_file(path):
+    """Read a small UTF-8 text file with raw os calls, skipping Python's buffered IO layers"""
+    fd = os.open(path, os.O_RDONLY | O_BINARY)
+    try:
+        data = os.read(fd, CAPTION_READ_SIZE)  # A short read means the whole file came back in one call
+        if len(data) == CAPTION_READ_SIZE:  # Unusually large caption, read the rest
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, CAPTION_READ_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+    # Match the universal newline handling of open(..., 'r'), CRLF files would otherwise show stray '\r's
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def write_text_file(path, text, durable=False):
+    """
+    Write a UTF-8 text file with raw os calls, replacing any existing content
+    By default the data is left in the OS page cache, durable=True also syncs it to the storage device
+    """
+    if os.linesep != '\n':  # Write the platform's line endings, as text-mode open() does
+        text = text.replace('\n', os.linesep)
+    data = text.encode('utf-8')
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o666)  # Same as open(), the umask trims it
+    try:
+        view = memoryview(data)
+        while view:  # os.write may write fewer bytes than requested
+            view = view[os.write(fd, view):]
+        if durable:
+            fdatasync(fd)
+    finally:
+        os.close(fd)
+
+
+class FolderPaths(Sequence):
+    """
+    Read-only list of full paths for files in one folder, built on demand from their names
+    Only the names are stored, so a large folder doesn't hold its directory prefix once per file
+    """
+    def __init__(self, folder_path, names):
+        self._dir = folder_path  # Directory shared by every path
+        self._names = names  # File names within the directory
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [os.path.join(self._dir, name) for name in self._names[index]]
+        return os.path.join(self._dir, self._names[index])
 
 
 class ImageCaptionEditor:
     """
     Class to manage the state and operations of the image caption editor
     """
+    # Fixed attribute set, for faster attribute access and no per-instance __dict__
+    __slots__ = (
+        '_n', 'current_index', 'image_files', 'txt_files', 'folder_path',
+        '_caption_cache', '_cache_lock', '_thumb_cache',
+        '_io_pool', '_dirty', '_save_timers', '_dirty_lock', '_warned',
+    )
+
     def __init__(self):
-        self.image_files = []  # List to store image file paths
+        self.image_files = []  # Image file paths, a FolderPaths once a folder is loaded
+        self.txt_files = []  # Caption file paths, parallel to image_files
+        self._n = 0  # Number of loaded images, cached for navigation bounds and status messages
         self.current_index = 0  # Index to keep track of the current image
         self.folder_path = None  # Path to the folder containing images
+        self._caption_cache = {}  # Captions keyed by image index, filled when a folder is loaded
+        self._cache_lock = threading.Lock()  # Guards the thumbnail cache against prefetch threads
+        self._thumb_cache = OrderedDict()  # LRU of display-sized PIL images keyed by image path
+        # Shared pool for caption preloading and image prefetching, created once for the app's lifetime
+        self._io_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='cap-io')
+        atexit.register(self._io_pool.shutdown, wait=False)
+        self._dirty = {}  # Saved captions not yet written to disk, keyed by image index
+        self._save_timers = {}  # Pending write-behind timers keyed by image index
+        self._dirty_lock = threading.Lock()  # Serialises caption writes between timers and handlers
+        self._warned = set()  # Indices whose failed write was already reported to the user
+        atexit.register(self.flush_all, fsync=True)  # Never lose a pending caption on shutdown
     
 
+    def _read_caption(self, index):
+        """Return the caption for an index, reading the text file only on a cache miss"""
+        caption = self._caption_cache.get(index)
+        if caption is None:
+            try:
+                caption = read_text_file(self.txt_files[index]).strip()
+            except FileNotFoundError:
+                caption = ""
+            self._caption_cache[index] = caption
+        return caption
+
+
+    def _safe_read_txt(self, txt_path):
+        """Read a caption file for the folder preload, returning None if it can't be read"""
+        try:
+            return read_text_file(txt_path).strip()
+        except FileNotFoundError:
+            return ""
+        except (OSError, UnicodeDecodeError):
+            return None  # Left uncached so the error surfaces when the image is viewed
+
+
+    def _preload_captions(self):
+        """Read every caption of the loaded folder into the cache in parallel"""
+        captions = list(self._io_pool.map(self._safe_read_txt, self.txt_files))
+        self._caption_cache = {
+            index: caption for index, caption in enumerate(captions) if caption is not None
+        }
+
+
+    def _make_thumb(self, image_path):
+        """Decode an image straight to display size and cache the result"""
+        with Image.open(image_path) as image:
+            image.draft('RGB', THUMB_SIZE)  # Lets JPEG decode at reduced scale, no-op for other formats
+            image.thumbnail(THUMB_SIZE, Image.Resampling.BILINEAR)  # Loads the pixels before the file closes
+
+        with self._cache_lock:
+            self._thumb_cache[image_path] = image
+            self._thumb_cache.move_to_end(image_path)
+            while len(self._thumb_cache) > THUMB_CACHE_SIZE:
+                self._thumb_cache.popitem(last=False)
+        return image
+
+
+    def _get_thumb(self, image_path):
+        """Return the display-sized version of an image, decoding it only on a cache miss"""
+        with self._cache_lock:
+            image = self._thumb_cache.get(image_path)
+            if image is not None:
+                self._thumb_cache.move_to_end(image_path)
+                return image
+        return self._make_thumb(image_path)
+
+
+    def _thumb_or_none(self, index):
+        """Return the display-sized image for an index, or None if it can't be decoded"""
+        try:
+            return self._get_thumb(self.image_files[index])
+        except (OSError, Image.UnidentifiedImageError):
+            return None  # get_current_pair already reported the error when the image was shown
+
+
+    def _prefetch_image(self, index):
+        """Decode the image at the given index into the thumbnail cache in the background"""
+        if 0 <= index < self._n:
+            self._io_pool.submit(self._get_thumb, self.image_files[index])
+
+
+    def _prefetch_adjacent_images(self):
+        """Warm the thumbnail cache with the images either side of the current one"""
+        self._prefetch_image(self.current_index + 1)
+        self._prefetch_image(self.current_index - 1)
+
+
+    def _flush_pending(self, index, fsync=False):
+        """
+        Write the pending caption for an index to disk, if there is one
+        A caption that fails to write stays pending, so it is retried and not lost
+        Returns: the exception raised by the write, or None
+        """
+        with self._dirty_lock:
+            timer = self._save_timers.pop(index, None)
+            if timer is not None:
+                timer.cancel()
+            caption = self._dirty.pop(index, None)
+            if caption is None:
+                return None
+            try:
+                write_text_file(self.txt_files[index], caption, durable=fsync)
+            except Exception as e:
+                self._dirty[index] = caption
+                print(f"Error saving caption for image {index + 1}: {e}")
+                return e
+            self._warned.discard(index)
+        return None
+
+
+    def _discard_pending(self, index):
+        """Drop the pending caption for an index, the text file keeps its last written content"""
+        with self._dirty_lock:
+            timer = self._save_timers.pop(index, None)
+            if timer is not None:
+                timer.cancel()
+            self._dirty.pop(index, None)
+            self._warned.discard(index)
+        self._caption_cache.pop(index, None)  # Re-read what is actually on disk
+
+
+    def _flush_or_warn(self, indices):
+        """
+        Write the pending captions for the given indices before the user leaves them
+        The first failed write of an index is reported and stops the user leaving, trying again
+        drops that edit so a write that keeps failing can't lock the editor
+        Returns: an error status, or None when it is fine to move on
+        """
+        failures = []
+        for index in indices:
+            error = self._flush_pending(index)
+            if error is None:
+                continue
+            if index in self._warned:
+                self._discard_pending(index)
+            else:
+                self._warned.add(index)
+                failures.append((index, error))
+        if not failures:
+            return None
+        index, error = failures[0]
+        return f"Error saving caption for image {index + 1}: {str(error)}. Try again to continue without saving it"
+
+
+    def flush_all(self, fsync=False):
+        """Write every pending caption to disk, syncing each file to the storage device if fsync is set"""
+        for index in list(self._dirty):
+            self._flush_pending(index, fsync=fsync)
+
+
+    def _reset_cache(self):
+        """Drop all cached captions and thumbnails"""
+        self._caption_cache = {}
+        with self._cache_lock:
+            self._thumb_cache.clear()
+
+
     def get_current_pair(self):
         """
-        Retrieve the current image path and its corresponding caption
-        Returns: tuple(image_path, caption, status_message)
+        Retrieve the current image and its corresponding caption
+        Returns: tuple(image, caption, status_message)
         """
-        if not self.image_files:
+        if not self._n:
             return None, "", "No images loaded"
         
-        image_path = self.image_files[self.current_index]
-        txt_path = image_path.replace('.png', '.txt')
-        
+        caption = self._read_caption(self.current_index)
         try:
-            with open(txt_path, 'r', encoding='utf-8') as f:
-                caption = f.read().strip()
-        except FileNotFoundError:
-            caption = ""
+            image = self._get_thumb(self.image_files[self.current_index])
+        except (OSError, Image.UnidentifiedImageError) as e:  # Corrupt or unreadable image, keep the caption editable
+            return None, caption, f"Error loading image {self.current_index + 1} of {self._n}: {str(e)}"
             
-        return image_path, caption, f"Showing image {self.current_index + 1} of {len(self.image_files)}"
+        return image, caption, f"Showing image {self.current_index + 1} of {self._n}"
 
 
     def load_folder(self, folder_path):
-        """Load all PNG files from the specified folder"""
+        """Load all supported image files from the specified folder"""
         if not folder_path:  # Check if no folder path is provided
             return None, "", "No folder selected"
         
@@ -46,115 +299,223 @@ class ImageCaptionEditor:
         elif isinstance(folder_path, dict):  # Check if folder_path is a dictionary
             folder_path = folder_path['path']  # Use the 'path' key from the dictionary
         
+        # Pending writes target the current folder's caption files, report any that can't be written
+        error = self._flush_or_warn(list(self._dirty))
+        if error is not None:
+            return gr.update(), gr.update(), error
+        # Get all image file names in a single directory scan, skipping hidden files like glob does
+        # (macOS writes '._name.png' AppleDouble files on external and network drives)
+        names = []
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() in IMG_EXTS and entry.is_file():
+                        names.append(entry.name)
+        except OSError as e:  # Missing, unreadable or not a folder, keep the current one loaded
+            return None, "", f"Error reading folder: {e}"
+        names.sort()
         self.folder_path = folder_path  # Set the folder path
-        self.image_files = sorted(glob.glob(os.path.join(folder_path, "*.png")))  # Get all PNG files in the folder
+
+        # Images with the same stem (a.png, a.jpg) would share one caption file, keep only the first
+        stems = set()
+        unique_names = []
+        txt_names = []  # Caption file names, derived once here rather than on every click
+        skipped = []
+        for name in names:
+            stem = os.path.splitext(name)[0]
+            if stem in stems:
+                skipped.append(name)
+            else:
+                stems.add(stem)
+                unique_names.append(name)
+                txt_names.append(stem + '.txt')
+        names = unique_names
+
+        self.image_files = FolderPaths(folder_path, names)
+        self.txt_files = FolderPaths(folder_path, txt_names)  # Matching caption paths
+        self._n = len(names)
+        self._reset_cache()  # Cached data belongs to the previous folder
+        self._preload_captions()
         
-        if not self.image_files:  # Check if no images are found
-            return None, "", "No PNG files found in the selected folder"
+        if not self._n:  # Check if no images are found
+            return None, "", "No image files found in the selected folder"
         
         self.current_index = 0  # Reset the current index
-        return self.get_current_pair()  # Return the first image details
+        image, caption, status = self.get_current_pair()  # Return the first image details
+        if skipped:
+            examples = ", ".join(skipped[:SKIPPED_NAMES_SHOWN])
+            if len(skipped) > SKIPPED_NAMES_SHOWN:
+                examples += ", ..."
+            status += f" (skipped {len(skipped)} image(s) sharing a caption file with another image: {examples})"
+        return image, caption, status
 
     
     def next_pair(self, _):
         """Move to next image if available"""
-        if self.current_index < len(self.image_files) - 1:  # Check if there is a next image
-            self.current_index += 1  # Increment the current index
+        if not self._n:
+            return self.get_current_pair()
+        if self.current_index >= self._n - 1:  # Nothing changes, leave the display as is
+            return gr.update(), gr.update(), f"Already at last image ({self.current_index + 1})"
+        error = self._flush_or_warn([self.current_index])  # Write the caption being left behind
+        if error is not None:  # Stay on the image so the failure isn't missed
+            return gr.update(), gr.update(), error
+        self.current_index += 1  # Increment the current index
+        self._prefetch_adjacent_images()
         return self.get_current_pair()  # Return the next image details
 
     
     def previous_pair(self, _):
         """Move to previous image if available"""
-        if self.current_index > 0:  # Check if there is a previous image
-            self.current_index -= 1  # Decrement the current index
+        if not self._n:
+            return self.get_current_pair()
+        if self.current_index <= 0:  # Nothing changes, leave the display as is
+            return gr.update(), gr.update(), "Already at first image (1)"
+        error = self._flush_or_warn([self.current_index])  # Write the caption being left behind
+        if error is not None:  # Stay on the image so the failure isn't missed
+            return gr.update(), gr.update(), error
+        self.current_index -= 1  # Decrement the current index
+        self._prefetch_adjacent_images()
         return self.get_current_pair()  # Return the previous image details
 
     
     def save_caption(self, caption):
-        """Save the caption to a text file"""
-        if not self.image_files:
+        """
+        Save the caption to a text file
+        The write is deferred until SAVE_DELAY seconds pass without another save of the same
+        image, or the user navigates away, so bursts of saves cost a single write
+        """
+        if not self._n:
             return None, caption, "No images loaded"
         
-        current_image = self.image_files[self.current_index]
-        txt_path = current_image.replace('.png', '.txt')
+        index = self.current_index
+        current_image = self._thumb_or_none(index)
+
+        self._caption_cache[index] = caption.strip()  # Keep the cache in step with the pending write
         
-        try:
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write(caption)
-            return current_image, caption, f"Caption saved for image {self.current_index + 1}"
-        except Exception as e:
-            return current_image, caption, f"Error saving caption: {str(e)}"
+        with self._dirty_lock:
+            self._dirty[index] = caption
+            self._warned.discard(index)  # A new edit gets its own failure report
+            timer = self._save_timers.pop(index, None)
+            if timer is not None:
+                timer.cancel()  # Restart the countdown on every save
+            timer = threading.Timer(SAVE_DELAY, self._flush_pending, args=(index,))
+            timer.daemon = True  # Shutdown is covered by the atexit flush
+            self._save_timers[index] = timer
+            timer.start()
+        return current_image, caption, f"Caption save pending for image {index + 1}"
+
+    def save_caption_durable(self, caption):
+        """Save the caption and write it straight to the storage device, skipping the write-behind delay"""
+        if not self._n:
+            return None, caption, "No images loaded"
+
+        index = self.current_index
+        current_image = self._thumb_or_none(index)
+
+        self._caption_cache[index] = caption.strip()  # Keep the cache in step with the file
+
+        with self._dirty_lock:
+            timer = self._save_timers.pop(index, None)
+            if timer is not None:
+                timer.cancel()  # This write supersedes any pending one
+            self._dirty.pop(index, None)
+            self._warned.discard(index)
+            try:
+                write_text_file(self.txt_files[index], caption, durable=True)
+            except Exception as e:
+                self._dirty[index] = caption  # Stays pending like a failed deferred write
+                return current_image, caption, f"Error saving caption: {str(e)}"
+        return current_image, caption, f"Caption saved and synced for image {index + 1}"
 
     def clear_all(self):
         """Clear all loaded data and reset the editor state"""
+        error = self._flush_or_warn(list(self._dirty))
+        if error is not None:  # Keep the folder loaded so the failure isn't missed
+            return gr.update(), gr.update(), error, gr.update(), gr.update()
         self.image_files = []
+        self.txt_files = []
+        self._n = 0
         self.current_index = 0
         self.folder_path = None
+        self._reset_cache()
         return None, "", "All fields cleared", "", 1
 
     def jump_to_pair(self, index):
         """Jump to a specific image index"""
         try:
             index = int(index) - 1  # Convert to 0-based index
-            if 0 <= index < len(self.image_files):
-                self.current_index = index
-                return self.get_current_pair()
-            return self.get_current_pair()[0], self.get_current_pair()[1], "Invalid image number"
-        except ValueError:
-            return self.get_current_pair()[0], self.get_current_pair()[1], "Please enter a valid number"
+        except (TypeError, ValueError):
+            image, caption, _ = self.get_current_pair()
+            return image, caption, "Please enter a valid number"
+        if 0 <= index < self._n:
+            error = self._flush_or_warn([self.current_index])  # Write the caption being left behind
+            if error is not None:  # Stay on the image so the failure isn't missed
+                return gr.update(), gr.update(), error
+            self.current_index = index
+            self._prefetch_adjacent_images()
+            return self.get_current_pair()
+        image, caption, _ = self.get_current_pair()
+        return image, caption, "Invalid image number"
+
+
+def tk_select_folder():
+    """Open Tk's folder dialog in-process, avoiding the startup cost of a dialog subprocess"""
+    root = tkinter.Tk()
+    try:
+        root.withdraw()  # Hide the empty root window, only the dialog should show
+        root.attributes('-topmost', True)  # Keep the dialog above the browser window
+        return filedialog.askdirectory(parent=root) or None
+    finally:
+        root.destroy()
+
+
+def _build_picker_cmd(system):
+    """
+    Return the folder dialog commands to try on the given operating system, in order
+    Each entry is (argv, script), where script is piped to the command's stdin or is None
+    """
+    if system == "darwin":  # macOS, osascript reads the script from stdin when given '-'
+        return [(['osascript', '-'], MACOS_PICKER_SCRIPT)]
+    if system == "windows":  # Windows, using PowerShell's folder picker dialog, -NoProfile skips loading user profiles
+        return [(['powershell', '-NoProfile', '-NonInteractive', '-Command', '-'], WINDOWS_PICKER_SCRIPT)]
+    if system == "linux":  # zenity is common on many distros (sudo apt-get install zenity), kdialog ships with KDE
+        return [
+            (['zenity', '--file-selection', '--directory'], None),
+            (['kdialog', '--getexistingdirectory'], None),
+        ]
+    return []
+
+
+PICKER_CMD = _build_picker_cmd(SYSTEM)  # Built once at import, each argv list is run without a shell
 
 
 def select_folder():
     """Open native file dialog and return selected folder path using the operating system's native dialog"""
-    system = platform.system().lower()
-
     try:
-        if system == "darwin":  # macOS
-            cmd = '''osascript -e 'tell application "System Events"
-                activate
-                set folderPath to choose folder
-                return POSIX path of folderPath
-            end tell' '''
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            folder_path = result.stdout.strip()
-            
-        elif system == "windows":  # Windows, using PowerShell's folder picker dialog
-            cmd = '''powershell -command "& {
-                Add-Type -AssemblyName System.Windows.Forms
-                $dialog = New-Object System.Windows.Forms.FolderBrowserDialog
-                $dialog.Description = 'Select a folder'
-                $dialog.ShowDialog() | Out-Null
-                $dialog.SelectedPath
-            }"'''
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            folder_path = result.stdout.strip()
-            
-        elif system == "linux":  # Linux
-            # Try using zenity (common on many Linux distros) sudo apt-get install zenity
+        # Tk must run on the main thread on macOS, but Gradio calls this from a worker thread
+        if SYSTEM != "darwin" and tkinter is not None:
             try:
-                result = subprocess.run(
-                    ['zenity', '--file-selection', '--directory'],
-                    capture_output=True,
-                    text=True
-                )
-                folder_path = result.stdout.strip()
-            except FileNotFoundError:
-                # Fallback to kdialog if zenity is not available
-                try:
-                    result = subprocess.run(
-                        ['kdialog', '--getexistingdirectory'],
-                        capture_output=True,
-                        text=True
-                    )
-                    folder_path = result.stdout.strip()
-                except FileNotFoundError:
-                    print("Error: Neither zenity nor kdialog is installed. Please install one of them.")
-                    return None
-        else:
-            print(f"Unsupported operating system: {system}")
+                return tk_select_folder()
+            except tkinter.TclError:
+                pass  # No display for Tk, fall through to the dialog commands below
+
+        if not PICKER_CMD:
+            print(f"Unsupported operating system: {SYSTEM}")
             return None
 
-        return folder_path if folder_path else None
+        for cmd, script in PICKER_CMD:
+            try:
+                result = subprocess.run(cmd, input=script, capture_output=True, text=True)
+            except FileNotFoundError:
+                continue  # Dialog tool not installed, try the next one
+            folder_path = result.stdout.strip()
+            return folder_path if folder_path else None
+
+        tools = ", ".join(cmd[0] for cmd, _ in PICKER_CMD)
+        print(f"Error: No folder dialog found. Please install one of: {tools}")
+        return None
         
     except Exception as e:
         print(f"Error selecting folder: {e}")
@@ -185,7 +546,7 @@ def create_interface():
         # Image and caption section side by side
         with gr.Row():
             image_output = gr.Image(
-                type="filepath",
+                type="pil",
                 label="Image",
                 width="500px",
                 scale=1
@@ -201,6 +562,7 @@ def create_interface():
             prev_btn = gr.Button("← Previous")
             next_btn = gr.Button("Next →")
             save_btn = gr.Button("Save Caption")
+            sync_btn = gr.Button("Save & Sync")
         
         # Status display
         status_output = gr.Textbox(label="Status", interactive=False)
@@ -221,7 +583,7 @@ def create_interface():
         def update_folder_and_load(folder_path):
             if folder_path:
                 result = editor.load_folder(folder_path)
-                return [folder_path, *result]
+                return [editor.folder_path, *result]  # Stays on the old folder if loading was refused
             return [None, None, "", "No folder selected"]
         
         select_btn.click(
@@ -251,6 +613,12 @@ def create_interface():
             outputs=[image_output, caption_input, status_output]
         )
         
+        sync_btn.click(
+            fn=editor.save_caption_durable,
+            inputs=[caption_input],
+            outputs=[image_output, caption_input, status_output]
+        )
+        
         clear_btn.click(
             fn=editor.clear_all,
             inputs=[],